@@ -8,6 +8,7 @@ For publication-style graphs can be integrated with TEX font rendering.
 """
 
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 import seaborn as sns
 import numpy as np
 
@@ -36,6 +37,96 @@ def make_better_graph(ax, x_new_ticks=None, y_new_ticks=None, only_new_ticks=Non
         add_custom_ticks(ax, new_locs=y_new_locs, new_labels=y_new_labels, which='y')
 
 
+def make_better_graph_fast(ax, x_new_ticks=None, y_new_ticks=None, only_new_ticks=None,
+                           x_factor=0.1, y_factor=0.1, despine=True):
+    """
+    Make a graph better, equivalent to `make_better_graph`.
+
+    Ticks and limits are fetched from `ax` only once per axis. Trimming and
+    merging of custom ticks happen in-memory, and the result is written back
+    to `ax` once.
+
+    Parameters
+    ----------
+    ax : matplotlib axis object
+      Axis to make better
+    x_new_ticks : dict, optional
+      Custom x-ticks to add, as {location: label}
+    y_new_ticks : dict, optional
+      Custom y-ticks to add, as {location: label}
+    only_new_ticks : {None, 'x', 'y', 'xy'}
+      Axes on which only the custom ticks must be shown
+    x_factor : float, {0.1}
+      Padding of the x-axis limits, relative to the last x-tick
+    y_factor : float, {0.1}
+      Padding of the y-axis limits, relative to the last y-tick
+    despine : bool, {True}
+      Remove the top and right spines
+
+    Returns
+    -------
+    None
+    """
+    # x-axis
+    xticks = np.asarray(ax.get_xticks())
+    xlo, xhi = sorted(ax.get_xlim())
+
+    if xticks.size != 0:
+        firsttick, lasttick, xticks = _trim_ticks(xticks, xlo, xhi)
+        ax.spines['bottom'].set_bounds(firsttick, lasttick)
+        ax.spines['top'].set_bounds(firsttick, lasttick)
+
+    x_min, x_max = xticks[0], xticks[-1]
+
+    xlocs = np.array([]) if only_new_ticks in ('x', 'xy') else xticks
+    if x_new_ticks is not None:
+        xlocs = np.round(xlocs, 9)  # Same rounding hack as in `add_custom_ticks`
+        xlabels = [str(tick) for tick in _tick_label_workaround(xlocs)]
+        xlocs, xlabels = _merge_ticks(xlocs, xlabels, list(x_new_ticks.keys()), list(x_new_ticks.values()))
+        ax.set_xticks(xlocs)
+        ax.set_xticklabels(xlabels)
+    else:
+        ax.set_xticks(xlocs)
+
+    # y-axis
+    yticks = np.asarray(ax.get_yticks())
+    ylo, yhi = sorted(ax.get_ylim())
+
+    if yticks.size != 0:
+        firsttick, lasttick, yticks = _trim_ticks(yticks, ylo, yhi)
+        ax.spines['left'].set_bounds(firsttick, lasttick)
+        ax.spines['right'].set_bounds(firsttick, lasttick)
+
+    y_min, y_max = yticks[0], yticks[-1]
+
+    ylocs = np.array([]) if only_new_ticks in ('y', 'xy') else yticks
+    if y_new_ticks is not None:
+        ylocs = np.round(ylocs, 9)  # Same rounding hack as in `add_custom_ticks`
+        ylabels = [str(tick) for tick in _tick_label_workaround(ylocs)]
+        ylocs, ylabels = _merge_ticks(ylocs, ylabels, list(y_new_ticks.keys()), list(y_new_ticks.values()))
+        ax.set_yticks(ylocs)
+        ax.set_yticklabels(ylabels)
+    else:
+        ax.set_yticks(ylocs)
+
+    # Rescale plot area
+    x_lower, x_upper = x_min - x_max * x_factor, x_max * (x_factor + 1)
+    y_lower, y_upper = y_min - y_max * y_factor, y_max * (y_factor + 1)
+
+    # Setting custom ticks after the limits (as `make_better_graph` does) expands the view to include them
+    if x_new_ticks is not None and xlocs.size != 0:
+        x_lower, x_upper = min(x_lower, xlocs[0]), max(x_upper, xlocs[-1])
+    if y_new_ticks is not None and ylocs.size != 0:
+        y_lower, y_upper = min(y_lower, ylocs[0]), max(y_upper, ylocs[-1])
+
+    ax.set_xlim(x_lower, x_upper)
+    ax.set_ylim(y_lower, y_upper)
+
+    if despine:
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+
+
 def beautify_bars_h(ax, index, rounding=2, factor=0.1, num_bars_per_group=1):
     """
     Beautify a horizontal bar plot.
@@ -57,7 +148,6 @@ def beautify_bars_h(ax, index, rounding=2, factor=0.1, num_bars_per_group=1):
     -------
     None
     """
-    max_value = 0
     num = len(ax.patches)
     p0 = ax.patches[0]
 
@@ -75,9 +165,8 @@ def beautify_bars_h(ax, index, rounding=2, factor=0.1, num_bars_per_group=1):
     yticks = index + ((num_bars_per_group - 1) / 2 * (width + gap))
 
     # Find where to extend the plot area to
-    for p in ax.patches:
-        if p.get_width() > max_value:
-            max_value = p.get_width()
+    widths = np.fromiter((p.get_width() for p in ax.patches), dtype=np.float64, count=num)
+    max_value = max(widths.max(), 0)
 
     ax.set_xticks([])  # set x-ticks
     ax.set_xlim(-factor * max_value,
@@ -90,26 +179,39 @@ def beautify_bars_h(ax, index, rounding=2, factor=0.1, num_bars_per_group=1):
     # The left-edge of the value text.
     font_begin = max_value * (1 + 2 * factor + 0.5 * factor)
 
-    # For each bar
-    for p in ax.patches:
-        val = np.round(p.get_width(), rounding)  # Round its value
-        # Draw the value as text on right-margin
+    # Gather remaining bar geometry once
+    xs_left = np.array([p.get_x() for p in ax.patches])
+    ys_bottom = np.array([p.get_y() for p in ax.patches])
+    heights = np.array([p.get_height() for p in ax.patches])
+    ys = ys_bottom + heights / 2  # Vertical centre of each bar
+
+    # Text positions and rounded values
+    text_xs = xs_left + font_begin
+    text_ys = ys_bottom + gap / 2
+    rounded = np.round(widths, rounding)
+
+    # Draw the value as text on right-margin of each bar
+    for i in range(num):
         ax.annotate(
-            val,
-            xy=(p.get_x() + font_begin, p.get_y() + gap / 2),
+            rounded[i],
+            xy=(text_xs[i], text_ys[i]),
             horizontalalignment='left',
-            xycoords='data')
+            xycoords='data',
+            annotation_clip=False)
 
-        # Draw the lines from bar to edge
-        xs = [p.get_width(), edge]
-        ys = [p.get_y() + p.get_height() / 2, p.get_y() + p.get_height() / 2]
-        ax.plot(xs, ys, color='k', linewidth=1)
+    # Draw the lines from bar to edge as a single collection
+    segments = np.empty((num, 2, 2))
+    segments[:, 0, 0] = widths
+    segments[:, 0, 1] = ys
+    segments[:, 1, 0] = edge
+    segments[:, 1, 1] = ys
+    # Limits are set explicitly above, so the lines needn't update them
+    ax.add_collection(LineCollection(segments, colors='k', linewidths=1), autolim=False)
 
-        # Remove spines
-        ax.spines['left'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.spines['bottom'].set_visible(False)
-        ax.spines['top'].set_visible(False)
+    # Remove spines
+    spines = ax.spines
+    for side in ('left', 'right', 'bottom', 'top'):
+        spines[side].set_visible(False)
 
 
 def _tick_label_workaround(ticks):
@@ -132,6 +234,58 @@ def _tick_label_workaround(ticks):
     return tick_labels
 
 
+def _unique_ticks(ticks, labels):
+    """
+    Remove duplicate tick locations from `ticks`, keeping the label of the last occurrence.
+
+    Returns the sorted unique tick locations and their labels.
+    """
+    ticks = np.asarray(ticks, dtype=np.float64)
+    num = ticks.size
+    ticks, last = np.unique(ticks[::-1], return_index=True)
+    labels = [labels[num - 1 - i] for i in last]
+
+    return ticks, labels
+
+
+def _merge_ticks(ticks, labels, new_locs, new_labels):
+    """
+    Merge new tick locations `new_locs` with labels `new_labels` into the sorted
+    tick locations `ticks` with labels `labels`.
+
+    New ticks at an existing location overwrite that tick's label. If a location
+    is given more than once in either `ticks` or `new_locs`, the last label wins.
+
+    Returns the merged (sorted) tick locations and their labels.
+    """
+    ticks, labels = _unique_ticks(ticks, labels)
+
+    # Pair up new locations and labels first, ignoring any without a partner
+    pairs = list(zip(new_locs, new_labels))
+    new_locs, new_labels = _unique_ticks([loc for loc, _ in pairs], [lab for _, lab in pairs])
+
+    idx = np.searchsorted(ticks, new_locs)
+
+    # New ticks that land on an existing tick only replace its label
+    exists = idx < ticks.size
+    exists[exists] = ticks[idx[exists]] == new_locs[exists]
+    for i in np.flatnonzero(exists):
+        labels[idx[i]] = new_labels[i]
+
+    # Remaining new ticks are inserted in sorted order
+    insert = ~exists
+    locs = np.insert(ticks, idx[insert], new_locs[insert])
+
+    is_new = np.zeros(locs.size, dtype=bool)
+    is_new[idx[insert] + np.arange(insert.sum())] = True
+
+    old_iter = iter(labels)
+    new_iter = iter([lab for lab, ins in zip(new_labels, insert) if ins])
+    labels = [next(new_iter) if new else next(old_iter) for new in is_new]
+
+    return locs, labels
+
+
 def add_custom_ticks(ax, new_locs, new_labels, which='x'):
     """
     Add custom ticks to plot axes `ax` on either the x or y axis at location `newLocs` with tick labels `newLabels`.
@@ -150,36 +304,18 @@ def add_custom_ticks(ax, new_locs, new_labels, which='x'):
     """
 
     ticks = None
-    labels = None
 
     if which == 'x':
-        ticks = ax.get_xticks()
         # hack that fixes a weird bug in mpl where a float will not be rounded correctly, causing havoc
-        ticks = [np.round(tick, 9) for tick in ticks]
-        tick_labels = _tick_label_workaround(ticks)
-
-        ax.set_xticklabels(tick_labels)  # "Set" ticks must be done to access text
-        labels = ax.get_xticklabels()
-        labels = [t.get_text() for t in labels]  # Extract text from labels
-
+        ticks = np.round(np.asarray(ax.get_xticks()), 9)
     elif which == 'y':
-        ticks = ax.get_yticks()
-        ticks = [np.round(tick, 9) for tick in ticks]  # Same hack as used for xticks above
-        tick_labels = _tick_label_workaround(ticks)
-
-        ax.set_yticklabels(tick_labels)
-        labels = ax.get_yticklabels()
-        labels = [t.get_text() for t in labels]
-
-    tick_dict = dict(zip(ticks, labels))  # Place ticks in dictionary
+        ticks = np.round(np.asarray(ax.get_yticks()), 9)  # Same hack as used for xticks above
 
-    # Update tick dictionary
-    for loc, lab in zip(new_locs, new_labels):
-        tick_dict[loc] = lab
+    # Format labels directly, rather than setting them on `ax` and reading the text back
+    labels = [str(tick) for tick in _tick_label_workaround(ticks)]
 
-    # Extract tick locations and labels
-    locs = list(tick_dict.keys())
-    labels = list(tick_dict.values())
+    # Merge new ticks into existing ticks
+    locs, labels = _merge_ticks(ticks, labels, new_locs, new_labels)
 
     # Set new Ticks
     if which == 'x':
@@ -190,6 +326,19 @@ def add_custom_ticks(ax, new_locs, new_labels, which='x'):
         ax.set_yticklabels(labels)
 
 
+def _trim_ticks(ticks, lo, hi):
+    """
+    Trim sorted tick locations `ticks` to those lying within [`lo`, `hi`].
+
+    Returns the first and last remaining tick, along with the trimmed ticks.
+    """
+    # Index of first tick above the lower limit, and one past the last tick below the upper limit
+    i0 = np.searchsorted(ticks, lo, side='left')
+    i1 = np.searchsorted(ticks, hi, side='right')
+
+    return ticks[i0], ticks[i1 - 1], ticks[i0:i1]
+
+
 def set_limits(ax, x_factor=0.1, y_factor=0.1, despine=True):
     """
     Set the limits of the axes, have them end with ticks.
@@ -207,54 +356,34 @@ def set_limits(ax, x_factor=0.1, y_factor=0.1, despine=True):
     """
 
     # x-axis
-    xticks = ax.get_xticks()
+    xticks = np.asarray(ax.get_xticks())
+    xlo, xhi = sorted(ax.get_xlim())
 
     # Trim
     if xticks.size != 0:
-        mask = xticks >= min(ax.get_xlim())  # Select all ticks _larger_ than the lower axis limit
-        firsttick = xticks[mask][0]  # Select first tick above the axis lower limit
-
-        mask = xticks <= max(ax.get_xlim())  # Select all ticks _smaller_ than the upper axis limit
-        lasttick = xticks[mask][-1]  # Select first tick below the axis upper limit
+        firsttick, lasttick, xticks = _trim_ticks(xticks, xlo, xhi)
 
         ax.spines['bottom'].set_bounds(firsttick, lasttick)
         ax.spines['top'].set_bounds(firsttick, lasttick)
 
-        # Mask our new ticks to be within the range of our "cut" axis
-        newticks = xticks[xticks <= lasttick]
-        newticks = newticks[newticks >= firsttick]
-
-        ax.set_xticks(newticks)
+        ax.set_xticks(xticks)
 
     # y-axis
-    yticks = ax.get_yticks()
+    yticks = np.asarray(ax.get_yticks())
+    ylo, yhi = sorted(ax.get_ylim())
 
     # Trim
     if yticks.size != 0:
-        mask = yticks >= min(ax.get_ylim())  # Select all ticks _larger_ than the lower axis limit
-        firsttick = yticks[mask][0]  # Select first tick above the axis lower limit
-
-        mask = yticks <= max(ax.get_ylim())  # Select all ticks _smaller_ than the upper axis limit
-        lasttick = yticks[mask][-1]  # Select first tick below the axis upper limit
+        firsttick, lasttick, yticks = _trim_ticks(yticks, ylo, yhi)
 
         ax.spines['left'].set_bounds(firsttick, lasttick)
         ax.spines['right'].set_bounds(firsttick, lasttick)
 
-        # Mask our new ticks to be within the range of our "cut" axis
-        newticks = yticks[yticks <= lasttick]
-        newticks = newticks[newticks >= firsttick]
-
-        ax.set_yticks(newticks)
-
-    # Update our working list of ticks
-    xticks = ax.get_xticks()
-    yticks = ax.get_yticks()
+        ax.set_yticks(yticks)
 
     # Rescale plot area
-    x_max = max(xticks)
-    x_min = min(xticks)
-    y_max = max(yticks)
-    y_min = min(yticks)
+    x_min, x_max = xticks[0], xticks[-1]
+    y_min, y_max = yticks[0], yticks[-1]
 
     ax.set_xlim(x_min - x_max * x_factor, x_max * (x_factor + 1))
     ax.set_ylim(y_min - y_max * y_factor, y_max * (y_factor + 1))
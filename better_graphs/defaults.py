@@ -1,12 +1,19 @@
 import seaborn as sns
 import matplotlib.pyplot as plt
 
+# Signature of the settings last applied by `set_pretty_defaults`, and the rc parameters that resulted
+_APPLIED_SIG = None
+_APPLIED_RC = {}
+
 
 def set_pretty_defaults(palette='Set1', context='paper', font_scale=2, line_width=2, tex=True, **kwargs):
     """
     Sets up good-looking default settings for matplotlib
     that form a good basis for 99% of graphs.
 
+    Calling this again with the same settings is a no-op, unless they have
+    since been changed (e.g. by `plt.rcdefaults()`).
+
     Parameters
     ----------
     palette : string, optional
@@ -17,11 +24,23 @@ def set_pretty_defaults(palette='Set1', context='paper', font_scale=2, line_widt
         Font-scaling to use with given context.
     line_width : float, optional
         Line width to use when drawing plots.
+    tex : bool or 'full', optional
+        Use Computer Modern fonts, with mathtext for labels wrapped in
+        `tex_label`. LaTeX escapes outside of `$...$` (e.g. '\\%') are
+        then rendered literally, so use plain text there (e.g. '%').
+        Use 'full' to render all text through LaTeX instead, which is
+        much slower.
     """
     
-    font = 'DejaVu Sans'
-    if 'font' in kwargs:
-        font = kwargs['font']
+    global _APPLIED_SIG, _APPLIED_RC
+
+    # Default to Computer Modern, unless all text is rendered through LaTeX
+    font = kwargs.get('font', 'DejaVu Sans' if tex == 'full' else 'CMU Serif')
+
+    # Nothing to do if these exact settings are already in place
+    sig = (palette, context, font_scale, line_width, tex, font)
+    if sig == _APPLIED_SIG and dict(plt.rcParams) == _APPLIED_RC:
+        return
 
     # Set Seaborn template
     sns.set_style('ticks')
@@ -29,16 +48,47 @@ def set_pretty_defaults(palette='Set1', context='paper', font_scale=2, line_widt
     sns.set_context(context, font_scale=font_scale)
 
     # Set Matplotlib tweaks
-    plt.rc('xtick', direction='in')
-    plt.rc('ytick', direction='in')
-    plt.rc('lines', linewidth=line_width)
+    rc_params = {
+        'xtick.direction': 'in',
+        'ytick.direction': 'in',
+        'lines.linewidth': line_width,
+    }
 
     # Additional matplotlib rc tweaks
     # plt.rc(**kwargs)
 
-    # Enable LaTeX font rendering
-    if tex:
-        plt.rc('text', usetex=True)
-        plt.rc('font', serif=font)
-        plt.rc('font', family='serif')
-        plt.rc('text.latex', preamble=r'\usepackage{amsmath}')
+    # Enable TeX-style font rendering
+    if tex == 'full':
+        # Render all text through LaTeX
+        rc_params.update({
+            'text.usetex': True,
+            'font.serif': font,
+            'font.family': 'serif',
+            'text.latex.preamble': r'\usepackage{amsmath}',
+        })
+    elif tex:
+        # Computer Modern fonts, using mathtext only for labels that need it (see `tex_label`)
+        rc_params.update({
+            'text.usetex': False,
+            'mathtext.fontset': 'cm',
+            # Fall back to matplotlib's serif fonts if CMU Serif isn't installed
+            'font.serif': [font] + plt.rcParamsDefault['font.serif'],
+            'font.family': 'serif',
+        })
+
+    plt.rcParams.update(rc_params)
+    _APPLIED_SIG = sig
+    # Snapshot all rc parameters (including those set by Seaborn), so any later change is detected
+    _APPLIED_RC = dict(plt.rcParams)
+
+
+def tex_label(s):
+    """
+    Wrap `s` in math mode, so that it is rendered with mathtext.
+
+    Parameters
+    ----------
+    s : string
+        TeX-formatted label text.
+    """
+    return r'$%s$' % s